@@ -2,18 +2,38 @@
 Database configuration and session handling using SQLAlchemy.
 """
 
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker, declarative_base
+from fastapi import Depends
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.orm import declarative_base
+from sqlalchemy.pool import AsyncAdaptedQueuePool
 from services.config import settings
 
-engine = create_engine(settings.DATABASE_URL, echo=True, future=True)
-SessionLocal = sessionmaker(bind=engine, autocommit=False, autoflush=False)
+# Pooled async engine: connections are reused (LIFO keeps the warm ones in rotation)
+# and pinged before checkout so stale MySQL sockets are replaced transparently.
+engine = create_async_engine(
+    settings.DATABASE_URL,
+    echo=settings.SQL_ECHO,
+    poolclass=AsyncAdaptedQueuePool,
+    pool_size=settings.DB_POOL_SIZE,
+    max_overflow=settings.DB_MAX_OVERFLOW,
+    pool_timeout=settings.DB_POOL_TIMEOUT,
+    pool_recycle=settings.DB_POOL_RECYCLE,
+    pool_pre_ping=True,
+    pool_use_lifo=True,
+)
+AsyncSessionLocal = async_sessionmaker(
+    engine, class_=AsyncSession, autoflush=False, expire_on_commit=False
+)
 Base = declarative_base()
 
-# Dependency for DB session injection in routes
-def get_db():
-    db = SessionLocal()
-    try:
+# Dependency for DB session injection in routes; read-only routes never issue a COMMIT
+async def get_db():
+    async with AsyncSessionLocal() as db:
         yield db
-    finally:
-        db.close()
+
+# Dependency for routes that write: shares the request's session and commits once the
+# route returns, while an exception skips the commit and the session rolls back on close.
+# Declare it with scope="function" so the commit runs before the response is sent.
+async def get_write_db(db: AsyncSession = Depends(get_db)):
+    yield db
+    await db.commit()
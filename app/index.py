@@ -14,12 +14,36 @@ Usage:
 """
 
 # Import the necessary modules
+import logging
+from contextlib import asynccontextmanager
 from decouple import config
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from routers.auth import auth_router
 from routers.home import home_router
 from routers.notes import note_router
+from sqlalchemy import text
+from db.database import engine
+from managers.users import redis_client
+
+# Configure logging once for the whole application; modules only call logging.getLogger(__name__)
+logging.basicConfig(
+    level=config("LOG_LEVEL", default="INFO").upper(),
+    format="%(asctime)s %(levelname)s %(name)s %(message)s",
+)
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """
+    Opens a pooled database connection on startup so the first requests skip the
+    connection handshake, and disposes of the pool and the Redis client on shutdown.
+    """
+    async with engine.connect() as conn:
+        await conn.execute(text("SELECT 1"))
+    yield
+    await engine.dispose()
+    if redis_client is not None:
+        await redis_client.aclose()
 
 class KeepNotesApplication:
     """
@@ -65,6 +89,7 @@ class KeepNotesApplication:
             title=self.title,
             description=self.description,
             version=self.version,
+            lifespan=lifespan,
         )
 
     def get_app(self) -> FastAPI:
@@ -6,22 +6,48 @@ and deleting users from the database. It interacts with the database layer, sche
 and authentication services.
 
 Dependencies:
-- AuthService: For password hashing and related authentication utilities.
-- conn: Database connection for interacting with the KnowledgeBase.
-- UserEntity, UsersEntity: Schema definitions for user data validation and transformation.
+- AsyncSession: Database session for interacting with the Mysql DB.
+- Redis: Optional short-lived cache in front of user lookups.
+- UserEntityTransformer: Transformation of user rows into dictionaries.
 """
 
+import logging
+import orjson
+from redis.asyncio import Redis
+from redis.exceptions import RedisError
 from models.user import UserEntityTransformer
 from fastapi import HTTPException
-from fastapi import Depends, HTTPException
-from sqlalchemy.orm import Session
+from sqlalchemy import bindparam, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
 from models.database import User
+from services.config import settings
+
+logger = logging.getLogger(__name__)
+
+# Shared Redis client for the user cache; None when no REDIS_URL is configured. Short
+# timeouts keep an unreachable Redis from stalling lookups before they fall back to MySQL.
+redis_client = Redis.from_url(
+    settings.REDIS_URL,
+    socket_connect_timeout=settings.REDIS_SOCKET_TIMEOUT,
+    socket_timeout=settings.REDIS_SOCKET_TIMEOUT,
+) if settings.REDIS_URL else None
+
+# Built once so SQLAlchemy's compiled cache is hit on every lookup. Only the
+# columns the transformer reads are selected, so no ORM instance is built.
+_USER_BY_EMAIL = select(
+    User.user_id,
+    User.user_name,
+    User.user_email,
+    User.password,
+    User.last_update,
+    User.created_on,
+).where(User.user_email == bindparam("email"))
 
 class FetchService:
     """Service class for user-related database operations such as adding users."""
 
     @staticmethod
-    async def get_user_by_email(email: str, db: Session):
+    async def get_user_by_email(email: str, db: AsyncSession):
         """
         Fetches a user by their email.
 
@@ -35,14 +61,84 @@ class FetchService:
             HTTPException: If the user is not found or if there is a failure during the database operation.
         """
 
+        user_data = await FetchService.find_user_by_email(email, db)
+        if user_data is None:
+            raise HTTPException(status_code=400, detail="User not found")
+        return user_data
+
+    @staticmethod
+    async def find_user_by_email(email: str, db: AsyncSession):
+        """
+        Looks up a user by their email without treating a missing user as an error.
+
+        Args:
+            email (str): The email of the user.
+
+        Returns:
+            dict | None: The user details transformed into a proper format, or None if no user has this email.
+
+        Raises:
+            HTTPException: If there is a failure during the database operation.
+        """
+
+        cache_key = f"user:{email}"
+        if redis_client is not None:
+            try:
+                cached = await redis_client.get(cache_key)
+                if cached:
+                    return orjson.loads(cached)
+            except (RedisError, orjson.JSONDecodeError) as e:
+                # Unreachable Redis or a corrupt entry: treat it as a miss
+                logger.warning("User cache read failed: %s", e)
+
         try:
-            user = db.query(User).filter(User.user_email == email).first()
+            result = await db.execute(_USER_BY_EMAIL, {"email": email})
+            user = result.first()
             if not user:
-                raise HTTPException(status_code=400, detail="User not found")
-            return UserEntityTransformer.user_entity(user)
+                return None
+            user_data = UserEntityTransformer.user_entity(user)
 
         except HTTPException as e:
             # Re-raise the HTTPException for cases like 400 errors.
             raise e
         except Exception as e:
             raise HTTPException(status_code=500, detail="Failed to fetch user") from e
+
+        if redis_client is not None:
+            try:
+                await redis_client.set(cache_key, orjson.dumps(user_data), ex=settings.USER_CACHE_TTL)
+            except RedisError as e:
+                logger.warning("User cache write failed: %s", e)
+        return user_data
+
+    @staticmethod
+    async def update_password(email: str, hashed_password: str, db: AsyncSession):
+        """
+        Stores a new password hash for a user. The caller commits the session and only
+        then evicts the cached user (evict_user), so a concurrent lookup cannot put the
+        old, still committed hash back into the cache.
+
+        Args:
+            email (str): The email of the user.
+            hashed_password (str): The new password hash.
+        """
+
+        await db.execute(
+            update(User).where(User.user_email == email).values(password=hashed_password)
+        )
+
+    @staticmethod
+    async def evict_user(email: str):
+        """
+        Removes a cached user so the next lookup reads from the database.
+
+        Args:
+            email (str): The email of the user.
+        """
+
+        if redis_client is None:
+            return
+        try:
+            await redis_client.delete(f"user:{email}")
+        except RedisError as e:
+            logger.warning("User cache eviction failed: %s", e)
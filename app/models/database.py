@@ -4,11 +4,13 @@ SQLAlchemy ORM models for User and Notes.
 
 import uuid
 from datetime import datetime
-from sqlalchemy import Column, String, DateTime, ForeignKey
+from sqlalchemy import Column, String, DateTime, ForeignKey, Index
 from sqlalchemy.dialects.mysql import CHAR
 from sqlalchemy.orm import relationship
 from db.database import Base
 
+# Primary keys are generated client side: MySQL cannot hand back a server-side
+# UUID() default, so the id is known without re-selecting the inserted row.
 def generate_uuid():
     return str(uuid.uuid4())
 
@@ -17,7 +19,7 @@ class User(Base):
 
     user_id = Column(CHAR(36), primary_key=True, default=generate_uuid)
     user_name = Column(String(100), nullable=False)
-    user_email = Column(String(120), unique=True, nullable=False)
+    user_email = Column(String(120), unique=True, index=True, nullable=False)
     password = Column(String(200), nullable=False)
     last_update = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
     created_on = Column(DateTime, default=datetime.utcnow)
@@ -26,6 +28,10 @@ class User(Base):
 
 class Note(Base):
     __tablename__ = "notes"
+    __table_args__ = (
+        # Serves the per-user lookups (user_id, note_id) and ordering by note_id
+        Index("ix_notes_user_note", "user_id", "note_id"),
+    )
 
     note_id = Column(CHAR(36), primary_key=True, default=generate_uuid)
     note_title = Column(String(200), nullable=False)
@@ -9,16 +9,30 @@ Dependencies:
 - FastAPI: For raising HTTP exceptions in case of errors.
 """
 
-import logging
+from datetime import datetime
 from fastapi import HTTPException
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter, ValidationError
+
+class UserDTO(BaseModel):
+    """
+    Serialized view of a Mysql DB user row, validated straight from ORM attributes.
+    """
+
+    model_config = ConfigDict(from_attributes=True)
+
+    id: str = Field(validation_alias="user_id")
+    name: str = Field(validation_alias="user_name")
+    email: str = Field(validation_alias="user_email")
+    password: str
+    last_update: datetime
+    created_on: datetime
 
-handler = logging.StreamHandler()
-formatter = logging.Formatter('%(asctime)s - %(levelname)s - %(message)s')
-handler.setFormatter(formatter)
+
+_USERS_ADAPTER = TypeAdapter(list[UserDTO])
 
 class UserEntityTransformer:
     """
-    Handles the transformation of MongoDB user entities into Python dictionaries.
+    Handles the transformation of Mysql DB user entities into Python dictionaries.
     Provides methods for individual and bulk entity conversions with error handling.
     """
 
@@ -39,25 +53,13 @@ class UserEntityTransformer:
                            (e.g., missing fields).
         """
         try:
-            return {
-                "id": str(item.user_id),
-                "name": item.user_name,
-                "email": item.user_email,
-                "password": item.password,
-                "last_update": item.last_update,
-                "created_on": item.created_on.strftime("%d-%m-%Y")
-            }
-
-        except KeyError as e:
+            return UserDTO.model_validate(item).model_dump(mode="json")
+
+        except ValidationError as e:
             raise HTTPException(
                 status_code=500,
                 detail="Key or field mismatch in Mysql DB document!"
             ) from e
-        except Exception as e:
-            raise HTTPException(
-                status_code=500,
-                detail="An unexpected error occurred during user entity transformation!"
-            ) from e
 
     @staticmethod
     def users_entity(entity: list) -> list:
@@ -74,9 +76,9 @@ class UserEntityTransformer:
             HTTPException: If there is an error during the transformation of any document.
         """
         try:
-            # Apply transformation to each user document in the list
-            return [UserEntityTransformer.user_entity(item) for item in entity]
-        except Exception as e:
+            # Validate the whole batch in a single call to the pydantic core
+            return _USERS_ADAPTER.dump_python(_USERS_ADAPTER.validate_python(entity), mode="json")
+        except ValidationError as e:
             raise HTTPException(
                 status_code=500,
                 detail="Failed to process user items from Mysql DB!"
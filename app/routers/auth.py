@@ -10,33 +10,38 @@ Features:
 - Issues JWT access tokens with configurable expiration.
 
 Dependencies:
-- AuthService: Handles password verification and token creation.
+- services.auth: Handles password verification and token creation.
 - UserService: Interacts with user data to retrieve user details.
 - Token: A Pydantic model representing the token response.
 - OAuth2PasswordRequestForm: Parses username/password for authentication requests.
 """
 
-from datetime import timedelta
 import logging
 from schemas.token import Token
-from services.auth import AuthService
+from services.auth import create_access_token, hash_password, verify_and_update_password
 from managers.users import FetchService
+from services.verify import AuthUsers
 from fastapi import APIRouter, HTTPException, Depends
 from fastapi.security import OAuth2PasswordRequestForm
-from sqlalchemy.orm import Session
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from db import database
 from models.database import User
-from schemas.register import UserCreate
+from schemas.register import RegisterResponse, UserCreate
+
+logger = logging.getLogger(__name__)
 
 # Define the token expiration time in minutes
 ACCESS_TOKEN_EXPIRE_MINUTES = 360
+# Converted once; each login only adds these seconds to the current epoch time
+ACCESS_TOKEN_EXPIRE_SECONDS = ACCESS_TOKEN_EXPIRE_MINUTES * 60
 auth_router = APIRouter(
     tags=["Authentication"]
 )
 
 @auth_router.post("/login_page")
-async def generate_access_token(form_data: OAuth2PasswordRequestForm = Depends(), db: Session = Depends(database.get_db)) -> Token:
+async def generate_access_token(form_data: OAuth2PasswordRequestForm = Depends(), db: AsyncSession = Depends(database.get_db)) -> Token:
     """
     Generate an access token for a valid user.
 
@@ -57,15 +62,15 @@ async def generate_access_token(form_data: OAuth2PasswordRequestForm = Depends()
 
     try:
         # Fetch the user by email (username from the form data)
-        print(form_data.username)
-        user = await FetchService.get_user_by_email(form_data.username, db)
-
-        if not user:
-            raise HTTPException(status_code=400, detail="Invalid username or password!")
+        user = await FetchService.find_user_by_email(form_data.username, db)
 
         try:
-            # Validate the user's password using a secure hash verification method
-            if not AuthService.verify_password(form_data.password, user["password"]):
+            # Validate the user's password using a secure hash verification method. Unknown
+            # users are checked against a dummy hash so both failures take the same time.
+            valid, updated_hash = await verify_and_update_password(
+                form_data.password, user["password"] if user else None
+            )
+            if not user or not valid:
                 raise HTTPException(status_code=400, detail="Invalid username or password!")
 
         except Exception as verify_error:
@@ -74,11 +79,22 @@ async def generate_access_token(form_data: OAuth2PasswordRequestForm = Depends()
                 detail="Invalid username or password!"
             ) from verify_error  # Explicitly chain the original exception
 
-        print(user["email"])
+        if updated_hash is not None:
+            # Legacy or outdated hash: store the rehashed password (rare, so committed here).
+            # This is only an upgrade, so a failed write must not block a valid login.
+            try:
+                await FetchService.update_password(user["email"], updated_hash, db)
+                await db.commit()
+                await FetchService.evict_user(user["email"])
+                AuthUsers.evict(user["email"])
+            except Exception:
+                await db.rollback()
+                logger.warning("password rehash failed for user=%s", user["email"], exc_info=True)
+
         # Create the JWT token with expiration
-        access_token = await AuthService.create_access_token(
+        access_token = await create_access_token(
             data={"sub": user["email"]},
-            expires_delta=timedelta(minutes=ACCESS_TOKEN_EXPIRE_MINUTES),
+            expires_delta=ACCESS_TOKEN_EXPIRE_SECONDS,
         )
 
         return Token(access_token=access_token, token_type="bearer", user_name=user["name"])
@@ -88,20 +104,20 @@ async def generate_access_token(form_data: OAuth2PasswordRequestForm = Depends()
         raise http_err
 
     except Exception as e:
-        print(e)
+        logger.exception("login failed for user=%s", form_data.username)
         raise HTTPException(status_code=500, detail="Internal Server Error") from e
 
-@auth_router.post("/signup_page", response_model=dict)
-def register(new_user: UserCreate, db: Session = Depends(database.get_db)):
+@auth_router.post("/signup_page", response_model=RegisterResponse)
+async def register(new_user: UserCreate, db: AsyncSession = Depends(database.get_write_db, scope="function")):
     """Register a new user with hashed password."""
-    existing = db.query(User).filter(User.user_email == new_user.user_email).first()
-    if existing:
-        raise HTTPException(status_code=400, detail="Email already registered")
-
-    hashed_pwd = AuthService.hash_password(new_user.password)
+    hashed_pwd = await hash_password(new_user.password)
     user_obj = User(user_name=new_user.user_name, user_email=new_user.user_email, password=hashed_pwd)
 
     db.add(user_obj)
-    db.commit()
-    db.refresh(user_obj)
+    try:
+        # The unique constraint on user_email rejects duplicates without a pre-check query
+        await db.flush()
+    except IntegrityError as e:
+        raise HTTPException(status_code=400, detail="Email already registered") from e
+    await FetchService.evict_user(new_user.user_email)
     return {"message": "User registered successfully"}
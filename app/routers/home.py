@@ -12,7 +12,7 @@ home_router = APIRouter(
 # Home Page Endpoint
 # ----------------------
 @home_router.post("/")
-async def homePage(current_user: dict = Depends(AuthUsers.get_current_user)):
+async def homePage(current_user: dict = Depends(AuthUsers.get_current_user)) -> str:
     """
     Home Page API endpoint.
 
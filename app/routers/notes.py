@@ -2,10 +2,14 @@
 API endpoints for Notes CRUD operations.
 """
 
-from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy.orm import Session
+import orjson
+from typing import Annotated
+from fastapi import APIRouter, Body, Depends, HTTPException, Query
+from fastapi.responses import StreamingResponse
+from sqlalchemy import insert, select
+from sqlalchemy.ext.asyncio import AsyncSession
 from db import database
-from models.database import User, Note
+from models.database import User, Note, generate_uuid
 from schemas import note
 from services.verify import AuthUsers
 
@@ -14,67 +18,125 @@ note_router = APIRouter(
 )
 
 # ---------------- CREATE NOTE ----------------
-@note_router.post("/create_notes", response_model=dict)
-def create_note(new_note: note.NoteBase, current_user: dict = Depends(AuthUsers.get_current_user), db: Session = Depends(database.get_db)):
+@note_router.post("/create_notes", response_model=note.NoteMessage)
+async def create_note(new_note: note.NoteBase, current_user: dict = Depends(AuthUsers.get_current_user), db: AsyncSession = Depends(database.get_write_db, scope="function")):
     """Create a new note."""
     note_obj = Note(
+        note_id=generate_uuid(),
         note_title=new_note.note_title,
         note_content=new_note.note_content,
         user_id=current_user["id"]
     )
     db.add(note_obj)
-    db.commit()
-    db.refresh(note_obj)
     return {"message": "Note created successfully", "note_id": note_obj.note_id}
 
 
+# ---------------- CREATE NOTES (BULK) ----------------
+@note_router.post("/create_notes_bulk", response_model=note.NoteBulkMessage)
+async def create_notes_bulk(
+    new_notes: Annotated[list[note.NoteBase], Body(min_length=1, max_length=500)],
+    current_user: dict = Depends(AuthUsers.get_current_user),
+    db: AsyncSession = Depends(database.get_write_db, scope="function")
+):
+    """Create several notes with a single batched INSERT and one commit."""
+    rows = [
+        {
+            "note_id": generate_uuid(),
+            "note_title": new_note.note_title,
+            "note_content": new_note.note_content,
+            "user_id": current_user["id"],
+        }
+        for new_note in new_notes
+    ]
+    await db.execute(insert(Note), rows)
+    return {"message": "Notes created successfully", "note_ids": [row["note_id"] for row in rows]}
+
+
 # ---------------- FETCH ALL NOTES ----------------
-@note_router.get("/fetch_all_notes", response_model=list[note.NoteResponse])
-def get_notes(
+@note_router.get("/fetch_all_notes", response_model=note.NotePage)
+async def get_notes(
+    cursor: str | None = Query(None, description="next_cursor from the previous page"),
+    limit: int = Query(50, ge=1, le=200),
     current_user: dict = Depends(AuthUsers.get_current_user),
-    db: Session = Depends(database.get_db)
+    db: AsyncSession = Depends(database.get_db)
 ):
-    """Retrieve all notes belonging to the logged-in user."""
+    """
+    Retrieve a page of notes belonging to the logged-in user, ordered by note_id, descending.
+
+    note_id is a random UUID, so this order is stable across pages but says nothing about
+    when a note was created: the first page is not the latest notes. Pass next_cursor as
+    cursor to fetch the following page; it is null on the last page.
+    """
     user_id = current_user["id"]
-    notes = db.query(Note).filter(Note.user_id == user_id).all()
-    return notes
+    stmt = select(Note).where(Note.user_id == user_id)
+    if cursor:
+        stmt = stmt.where(Note.note_id < cursor)
+
+    # Fetch one extra row to know whether another page follows
+    result = await db.execute(stmt.order_by(Note.note_id.desc()).limit(limit + 1))
+    notes = result.scalars().all()
+    next_cursor = notes[limit - 1].note_id if len(notes) > limit else None
+    return {"items": notes[:limit], "next_cursor": next_cursor}
+
+
+# ---------------- EXPORT NOTES ----------------
+@note_router.get("/export_notes")
+async def export_notes(
+    current_user: dict = Depends(AuthUsers.get_current_user),
+    db: AsyncSession = Depends(database.get_db)
+):
+    """Stream every note belonging to the logged-in user as newline-delimited JSON."""
+    stmt = (
+        select(Note)
+        .where(Note.user_id == current_user["id"])
+        .order_by(Note.note_id.desc())
+        .execution_options(yield_per=200)
+    )
+
+    async def stream_notes():
+        # The request-scoped session (shared with get_current_user) stays open until the
+        # response has been sent, so the stream reuses its connection
+        result = await db.stream_scalars(stmt)
+        async for note_obj in result:
+            yield orjson.dumps(note.NoteResponse.model_validate(note_obj).model_dump()) + b"\n"
+
+    return StreamingResponse(stream_notes(), media_type="application/x-ndjson")
 
 
 # ---------------- UPDATE NOTE ----------------
-@note_router.put("/update_note/{note_id}", response_model=dict)
-def update_note(
+@note_router.put("/update_note/{note_id}", response_model=note.NoteMessage)
+async def update_note(
     note_id: str,
     updated_note: note.NoteUpdate,
     current_user: dict = Depends(AuthUsers.get_current_user),
-    db: Session = Depends(database.get_db)
+    db: AsyncSession = Depends(database.get_write_db, scope="function")
 ):
     """Update an existing note."""
     user_id = current_user["id"]
-    note_obj = db.query(Note).filter(Note.note_id == note_id, Note.user_id == user_id).first()
+    result = await db.execute(select(Note).where(Note.note_id == note_id, Note.user_id == user_id))
+    note_obj = result.scalar_one_or_none()
 
     if not note_obj:
         raise HTTPException(status_code=404, detail="Note not found or not authorized")
     note_obj.note_content = updated_note.note_content
 
-    db.commit()
-    db.refresh(note_obj)
     return {"message": "Note updated successfully", "note_id": note_obj.note_id}
 
 
 # ---------------- DELETE NOTE ----------------
-@note_router.delete("/delete_note/{note_id}", response_model=dict)
-def delete_note(
+@note_router.delete("/delete_note/{note_id}", response_model=note.NoteMessage)
+async def delete_note(
     note_id: str,
     current_user: dict = Depends(AuthUsers.get_current_user),
-    db: Session = Depends(database.get_db)
+    db: AsyncSession = Depends(database.get_write_db, scope="function")
 ):
     """Delete a note by ID."""
     user_id = current_user["id"]
-    note_obj = db.query(Note).filter(Note.note_id == note_id, Note.user_id == user_id).first()
+    result = await db.execute(select(Note).where(Note.note_id == note_id, Note.user_id == user_id))
+    note_obj = result.scalar_one_or_none()
 
     if not note_obj:
         raise HTTPException(status_code=404, detail="Note not found or not authorized")
 
-    db.delete(note_obj)
-    db.commit()
+    await db.delete(note_obj)
     return {"message": "Note deleted successfully", "note_id": note_id}
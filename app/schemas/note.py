@@ -20,3 +20,15 @@ class NoteResponse(NoteBase):
 
     class Config:
         from_attributes = True
+
+class NoteMessage(BaseModel):
+    message: str
+    note_id: str
+
+class NoteBulkMessage(BaseModel):
+    message: str
+    note_ids: list[str]
+
+class NotePage(BaseModel):
+    items: list[NoteResponse]
+    next_cursor: str | None = None
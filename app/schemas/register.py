@@ -4,3 +4,6 @@ class UserCreate(BaseModel):
     user_name: str
     user_email: EmailStr
     password: str
+
+class RegisterResponse(BaseModel):
+    message: str
@@ -4,18 +4,19 @@ Module: Authentication Utilities
 This module provides authentication-related utilities, including password hashing,
 password verification, and JWT token generation/validation.
 
-It leverages bcrypt for secure password hashing and JWT for access token management.
-The AuthService class contains static methods for these operations.
+It leverages argon2 for secure password hashing and JWT for access token management.
+These operations are module-level functions; the AuthService class re-exposes them as
+static methods for existing callers.
 
 Features:
-- Hash plaintext passwords using bcrypt.
+- Hash plaintext passwords using argon2.
 - Verify plaintext passwords against hashed counterparts.
 - Create JWT tokens with expiration.
 - Decode and validate JWT tokens, handling expiration and invalid token scenarios.
 
 Dependencies:
 - jwt: For encoding and decoding JSON Web Tokens (JWT).
-- passlib: For secure password hashing and verification.
+- pwdlib: For secure password hashing and verification.
 - fastapi: For HTTP exceptions used in error handling.
 
 Configuration:
@@ -23,100 +24,322 @@ Configuration:
 - ALGORITHM: The algorithm used for signing JWT tokens.
 """
 
-from datetime import datetime, timedelta, timezone
-from jose import jwt
+import hashlib
+import hmac
+import logging
+import threading
+import time
+import anyio
+import orjson
+from datetime import timedelta
+from cachetools import LRUCache, TTLCache
+import jwt
+from jwt.algorithms import HMACAlgorithm
 from pwdlib import PasswordHash
+from pwdlib.hashers.argon2 import Argon2Hasher
+from pwdlib.hashers.bcrypt import BcryptHasher
 from fastapi import HTTPException
 from services.config import settings
 
-# Password hashing context
-password_hash = PasswordHash.recommended()
+__all__ = [
+    "AuthService",
+    "create_access_token",
+    "decode_access_token",
+    "hash_password",
+    "password_hash",
+    "verify_and_update_password",
+    "verify_password",
+]
+
+logger = logging.getLogger(__name__)
+
+# Password hashing context, built once at import with costs pinned from settings.
+# New hashes use argon2id; bcrypt is only kept so legacy hashes still verify and
+# get rehashed on the next successful login.
+password_hash = PasswordHash((
+    Argon2Hasher(
+        time_cost=settings.PASSWORD_HASH_TIME_COST,
+        memory_cost=settings.PASSWORD_HASH_MEMORY_COST,
+        parallelism=settings.PASSWORD_HASH_PARALLELISM,
+    ),
+    BcryptHasher(),
+))
+
+# Default token lifetime, converted once instead of on every token
+_DEFAULT_TTL_SECONDS = settings.ACCESS_TOKEN_EXPIRE_MINUTES * 60
+
+# Stand-in hash checked for unknown users, so a failed login costs the same whether
+# or not the account exists and response times do not reveal registered emails
+_DUMMY_HASH = password_hash.hash("x" * 16)
+
+# Dedicated worker threads for the KDF, one per core: argon2 and bcrypt release the GIL
+# while hashing, so concurrent logins run in parallel without a process pool, and a
+# login burst cannot take over the threadpool shared with the rest of the app.
+_hash_limiter = anyio.CapacityLimiter(settings.PASSWORD_HASH_WORKERS)
+
+class _PrecomputedHMAC(HMACAlgorithm):
+    """
+    HMAC algorithm bound to the application's secret. The key is validated and the
+    keyed hash state (ipad/opad) is built once; each signature clones that state
+    instead of redoing the key setup. Any other key takes the regular path.
+    """
+
+    def __init__(self, hash_alg, secret: str):
+        super().__init__(hash_alg)
+        self._secret = secret
+        self._key = super().prepare_key(secret)
+        self._hmac = hmac.new(self._key, digestmod=hash_alg)
+
+    def prepare_key(self, key: str | bytes) -> bytes:
+        if key is self._secret:
+            return self._key
+        return super().prepare_key(key)
+
+    def sign(self, msg: bytes, key: bytes) -> bytes:
+        if key is not self._key:
+            return super().sign(msg, key)
+        mac = self._hmac.copy()
+        mac.update(msg)
+        return mac.digest()
+
+_HMAC_HASHES = {"HS256": hashlib.sha256, "HS384": hashlib.sha384, "HS512": hashlib.sha512}
+
+# Signs and verifies the compact token only; the claims are serialized with orjson
+# below, so the stdlib json round-trip in jwt.encode/jwt.decode is skipped
+_jws = jwt.PyJWS()
+if settings.ALGORITHM in _HMAC_HASHES:
+    _jws.unregister_algorithm(settings.ALGORITHM)
+    _jws.register_algorithm(
+        settings.ALGORITHM,
+        _PrecomputedHMAC(_HMAC_HASHES[settings.ALGORITHM], settings.SECRET_KEY),
+    )
+
+# Payloads of already verified tokens, reused until the token's own expiry
+_token_cache = LRUCache(maxsize=10_000)
+_token_cache_lock = threading.Lock()
+
+# Recently rejected tokens and their 401 detail, so a token replayed in a loop is
+# turned away without being decoded again (shares _token_cache_lock)
+_rejected_tokens = TTLCache(maxsize=10_000, ttl=5)
+
+# Generous upper bound for an HS* JWT; anything longer is rejected before decoding
+_MAX_TOKEN_LENGTH = 4096
+
+# bcrypt only ever used the first 72 bytes of a password, and bcrypt>=5 refuses longer
+# input instead of truncating it, so legacy hashes are checked against that prefix
+_BCRYPT_MAX_BYTES = 72
+
+
+def _password_bytes(password: str | bytes) -> bytes:
+    """Encodes a password to UTF-8 once, passing bytes through unchanged."""
+    return password.encode("utf-8") if isinstance(password, str) else password
+
+
+def _verify(password: bytes, hashed_password: str) -> bool:
+    """Checks a password, truncated the way bcrypt did when the hash is a legacy one."""
+    if BcryptHasher.identify(hashed_password):
+        password = password[:_BCRYPT_MAX_BYTES]
+    return password_hash.verify(password, hashed_password)
+
+
+def _verify_and_update(password: bytes, hashed_password: str) -> tuple[bool, str | None]:
+    """
+    Checks a password and returns a fresh argon2 hash when the stored one is outdated.
+    A legacy bcrypt hash is rehashed from the full password, not its 72-byte prefix.
+    """
+    if BcryptHasher.identify(hashed_password):
+        if not _verify(password, hashed_password):
+            return False, None
+        return True, password_hash.hash(password)
+    return password_hash.verify_and_update(password, hashed_password)
+
+
+async def hash_password(password: str | bytes) -> str:
+    """
+    Hashes the given password using argon2, in a worker thread so the event loop
+    keeps serving other requests.
+
+    Args:
+        password (str | bytes): The plaintext password; str is encoded to UTF-8 once.
+
+    Returns:
+        str: The hashed password.
+
+    Raises:
+        HTTPException: If there is an error while hashing the password.
+    """
+    try:
+        return await anyio.to_thread.run_sync(password_hash.hash, _password_bytes(password), limiter=_hash_limiter)
+    except Exception as e:
+        raise HTTPException(status_code=500, detail="Failed to hash password") from e
+
+
+async def verify_password(plain_password: str | bytes, hashed_password: str) -> bool:
+    """
+    Verifies a plaintext password against its hashed counterpart, in a worker thread.
+
+    Args:
+        plain_password (str | bytes): The plaintext password.
+        hashed_password (str): The hashed password.
+
+    Returns:
+        bool: True if the password matches, otherwise False.
+
+    Raises:
+        HTTPException: If there is an error while verifying the password.
+    """
+    try:
+        return await anyio.to_thread.run_sync(
+            _verify, _password_bytes(plain_password), hashed_password, limiter=_hash_limiter
+        )
+    except Exception as e:
+        raise HTTPException(status_code=500, detail="Failed to verify password") from e
+
+
+async def verify_and_update_password(plain_password: str | bytes, hashed_password: str | None) -> tuple[bool, str | None]:
+    """
+    Verifies a plaintext password and rehashes it if the stored hash is outdated,
+    in a worker thread.
+
+    Args:
+        plain_password (str | bytes): The plaintext password.
+        hashed_password (str | None): The hashed password, or None for an unknown user,
+            in which case a dummy hash is checked and the result is always False.
+
+    Returns:
+        tuple[bool, str | None]: Whether the password matches, and a new hash to store
+        when the stored one uses a legacy algorithm or outdated cost parameters.
+
+    Raises:
+        HTTPException: If there is an error while verifying the password.
+    """
+    if hashed_password is None:
+        await verify_password(plain_password, _DUMMY_HASH)
+        return False, None
+    try:
+        return await anyio.to_thread.run_sync(
+            _verify_and_update, _password_bytes(plain_password), hashed_password, limiter=_hash_limiter
+        )
+    except Exception as e:
+        raise HTTPException(status_code=500, detail="Failed to verify password") from e
+
+
+async def create_access_token(data: dict, expires_delta: timedelta | int | None = None) -> str:
+    """
+    Creates a JWT token with the specified payload and expiration.
+
+    Args:
+        data (dict): The payload data to encode in the token.
+        expires_delta (timedelta | int, optional): Token expiration time, as a timedelta or
+            in whole seconds. Defaults to ACCESS_TOKEN_EXPIRE_MINUTES.
+
+    Returns:
+        str: Encoded JWT token.
+
+    Raises:
+        HTTPException: If there is an error while creating the access token.
+    """
+    try:
+        # Integer epoch seconds are a valid "exp" claim and skip datetime arithmetic
+        if expires_delta is None:
+            ttl = _DEFAULT_TTL_SECONDS
+        elif isinstance(expires_delta, int):
+            ttl = expires_delta
+        else:
+            ttl = int(expires_delta.total_seconds())
+        to_encode = {**data, "exp": int(time.time()) + ttl}
+        encoded_token = _jws.encode(
+            orjson.dumps(to_encode), settings.SECRET_KEY, algorithm=settings.ALGORITHM
+        )
+        return encoded_token
+    except Exception as e:
+        logger.error("Failed to create access token: %s", e)
+        raise HTTPException(status_code=500, detail="Failed to create access token") from e
+
+
+def decode_access_token(token: str) -> dict:
+    """
+    Decodes and validates a JWT token. Verified payloads are cached until the token expires,
+    and rejected tokens for a few seconds.
+
+    Args:
+        token (str): The JWT token to decode.
+
+    Returns:
+        dict: The decoded token payload.
+
+    Raises:
+        HTTPException: If the token is invalid or expired.
+    """
+    if len(token) > _MAX_TOKEN_LENGTH or token.count(".") != 2:
+        raise HTTPException(status_code=401, detail="Invalid token")
+
+    with _token_cache_lock:
+        cached = _token_cache.get(token)
+        rejected = _rejected_tokens.get(token)
+    if rejected is not None:
+        raise HTTPException(status_code=401, detail=rejected)
+    if cached is not None:
+        payload, expires_at = cached
+        if expires_at > time.time():
+            return payload
+        with _token_cache_lock:
+            _token_cache.pop(token, None)
+
+    try:
+        decoded_token = _verify_token(token)
+    except HTTPException as e:
+        with _token_cache_lock:
+            _rejected_tokens[token] = e.detail
+        raise
+
+    expires_at = decoded_token.get("exp")
+    if expires_at is not None:
+        with _token_cache_lock:
+            _token_cache[token] = (decoded_token, expires_at)
+    return decoded_token
+
+
+def _verify_token(token: str) -> dict:
+    """
+    Verifies the token signature and expiry, without consulting any cache.
+
+    Args:
+        token (str): The JWT token to verify.
+
+    Returns:
+        dict: The decoded token payload.
+
+    Raises:
+        HTTPException: If the token is invalid or expired.
+    """
+    try:
+        decoded_token = orjson.loads(
+            _jws.decode(token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM])
+        )
+    except (jwt.InvalidTokenError, orjson.JSONDecodeError) as e:
+        raise HTTPException(status_code=401, detail="Invalid token") from e
+
+    if not isinstance(decoded_token, dict):
+        raise HTTPException(status_code=401, detail="Invalid token")
+    # Claims are parsed here rather than by jwt.decode, so the expiry is checked here too
+    expires_at = decoded_token.get("exp")
+    if expires_at is not None:
+        if not isinstance(expires_at, (int, float)) or isinstance(expires_at, bool):
+            raise HTTPException(status_code=401, detail="Invalid token")
+        if expires_at <= time.time():
+            raise HTTPException(status_code=401, detail="Token expired")
+    return decoded_token
+
 
 class AuthService:
-    """Service class for authentication-related utilities."""
-
-    @staticmethod
-    def hash_password(password: str) -> str:
-        """
-        Hashes the given password using bcrypt.
-
-        Args:
-            password (str): The plaintext password.
-
-        Returns:
-            str: The hashed password.
-
-        Raises:
-            HTTPException: If there is an error while hashing the password.
-        """
-        try:
-            return password_hash.hash(password)
-        except Exception as e:
-            raise HTTPException(status_code=500, detail="Failed to hash password") from e
-
-    @staticmethod
-    def verify_password(plain_password: str, hashed_password: str) -> bool:
-        """
-        Verifies a plaintext password against its hashed counterpart.
-
-        Args:
-            plain_password (str): The plaintext password.
-            hashed_password (str): The hashed password.
-
-        Returns:
-            bool: True if the password matches, otherwise False.
-
-        Raises:
-            HTTPException: If there is an error while verifying the password.
-        """
-        try:
-            return password_hash.verify(plain_password, hashed_password)
-        except Exception as e:
-            raise HTTPException(status_code=500, detail="Failed to verify password") from e
-
-    @staticmethod
-    async def create_access_token(data: dict, expires_delta: timedelta | None = None) -> str:
-        """
-        Creates a JWT token with the specified payload and expiration.
-
-        Args:
-            data (dict): The payload data to encode in the token.
-            expires_delta (timedelta, optional): Token expiration time. Defaults to 15 minutes.
-
-        Returns:
-            str: Encoded JWT token.
-
-        Raises:
-            HTTPException: If there is an error while creating the access token.
-        """
-        try:
-            to_encode = data.copy()
-            expire = datetime.now(timezone.utc) + (expires_delta or timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES))
-            to_encode.update({"exp": expire})
-            encoded_token = jwt.encode(to_encode, settings.SECRET_KEY, algorithm=settings.ALGORITHM)
-            return encoded_token
-        except Exception as e:
-            print(e)
-            raise HTTPException(status_code=500, detail="Failed to create access token") from e
-
-    @staticmethod
-    async def decode_access_token(token: str) -> dict:
-        """
-        Decodes and validates a JWT token.
-
-        Args:
-            token (str): The JWT token to decode.
-
-        Returns:
-            dict: The decoded token payload.
-
-        Raises:
-            HTTPException: If the token is invalid or expired.
-        """
-        try:
-            decoded_token = jwt.decode(token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM])
-            return decoded_token
-        except jwt.ExpiredSignatureError as e:
-            raise HTTPException(status_code=401, detail="Token expired") from e
-        except jwt.InvalidTokenError as e:
-            raise HTTPException(status_code=401, detail="Invalid token") from e
+    """
+    Service class for authentication-related utilities. Kept for existing callers;
+    it exposes the module-level functions above, which new code can import directly.
+    """
+
+    hash_password = staticmethod(hash_password)
+    verify_password = staticmethod(verify_password)
+    verify_and_update_password = staticmethod(verify_and_update_password)
+    create_access_token = staticmethod(create_access_token)
+    decode_access_token = staticmethod(decode_access_token)
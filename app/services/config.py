@@ -1,25 +1,52 @@
 """
 Configuration file for environment variables and global settings.
+
+Values are read from the environment once at startup and parsed into their declared
+types by pydantic-settings, so the rest of the application only sees validated values.
 """
 
 import os
 from dotenv import load_dotenv
+from pydantic import AliasChoices, Field
+from pydantic_settings import BaseSettings
+
+__all__ = ["Settings", "settings"]
 
 # Load environment variables from .env file
 load_dotenv()
 
-class Settings:
+class Settings(BaseSettings):
     PROJECT_NAME: str = "Keep Notes API"
     VERSION: str = "1.0.0"
 
     # Database settings
-    DATABASE_URL: str = os.getenv(
-        "DATABASE_URL",
-    )
+    DATABASE_URL: str
+    SQL_ECHO: bool = False
+
+    # Connection pool settings
+    DB_POOL_SIZE: int = 20
+    DB_MAX_OVERFLOW: int = 10
+    DB_POOL_TIMEOUT: int = 30
+    DB_POOL_RECYCLE: int = 1800
+
+    # Cache settings (the user cache is disabled when REDIS_URL is unset)
+    REDIS_URL: str | None = None
+    USER_CACHE_TTL: int = 60
+    REDIS_SOCKET_TIMEOUT: float = 0.5
+    AUTH_CACHE_TTL: int = 30
+
+    # Password hashing (argon2id) cost parameters, OWASP baseline by default
+    PASSWORD_HASH_TIME_COST: int = 2
+    PASSWORD_HASH_MEMORY_COST: int = 19456
+    PASSWORD_HASH_PARALLELISM: int = 1
+    PASSWORD_HASH_WORKERS: int = Field(default_factory=lambda: os.cpu_count() or 1)
 
     # JWT settings
-    SECRET_KEY: str = os.getenv("SECRET_KEY")
-    ALGORITHM: str = os.getenv("ALGORITHM")
-    ACCESS_TOKEN_EXPIRE_MINUTES: int = os.getenv("TIME_LIMIT")
+    SECRET_KEY: str
+    ALGORITHM: str = "HS256"
+    ACCESS_TOKEN_EXPIRE_MINUTES: int = Field(
+        default=30,
+        validation_alias=AliasChoices("ACCESS_TOKEN_EXPIRE_MINUTES", "TIME_LIMIT"),
+    )
 
 settings = Settings()
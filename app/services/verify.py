@@ -13,17 +13,39 @@ Dependencies:
 - `get_user`: Fetches user details from the database.
 - Pydantic models: For type validation of user and token data.
 """
+import logging
 from typing import Annotated
-from pydantic import ValidationError
-from fastapi import Depends, HTTPException, Security, status
+from cachetools import TTLCache
+from fastapi import Depends, HTTPException, Request, Security, status
 from fastapi.security import OAuth2PasswordBearer
 from managers.users import FetchService
-from services.auth import AuthService
-from schemas.token import TokenData
+from services.auth import decode_access_token
 from schemas.register import UserCreate
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from db import database
+from services.config import settings
+
+logger = logging.getLogger(__name__)
+
+class BearerTokenScheme(OAuth2PasswordBearer):
+    """
+    OAuth2 password bearer scheme with a lighter header parse. The OpenAPI security
+    definition is inherited unchanged; extracting the token is a single prefix
+    comparison and slice instead of splitting and lowercasing the scheme.
+    """
+
+    async def __call__(self, request: Request) -> str | None:
+        authorization = request.headers.get("authorization")
+        if authorization and authorization[:7].lower() == "bearer ":
+            return authorization[7:]
+        if self.auto_error:
+            raise HTTPException(
+                status_code=status.HTTP_401_UNAUTHORIZED,
+                detail="Not authenticated",
+                headers={"WWW-Authenticate": "Bearer"},
+            )
+        return None
 
 class AuthUsers:
     """
@@ -31,16 +53,22 @@ class AuthUsers:
     """
 
     # Class-level variables
-    oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/Homepage/login_page")
+    oauth2_scheme = BearerTokenScheme(
+        tokenUrl="/Homepage/login_page", scheme_name="OAuth2PasswordBearer"
+    )
     credentials_exception = HTTPException(
         status_code=status.HTTP_401_UNAUTHORIZED,
         detail="Could not validate credentials",
         headers={"WWW-Authenticate": "Bearer"},
     )
+    # Resolved users keyed by email, kept well below the token lifetime; evict() drops
+    # an entry as soon as the stored user changes
+    user_cache = TTLCache(maxsize=10_000, ttl=settings.AUTH_CACHE_TTL)
 
+    @staticmethod
     async def get_current_user(
         token: Annotated[str, Depends(oauth2_scheme)],
-        db: Session = Depends(database.get_db)
+        db: AsyncSession = Depends(database.get_db)
     ) -> dict:
         """
         Decode and validate the current user's JWT token.
@@ -54,29 +82,37 @@ class AuthUsers:
         Raises:
             HTTPException: If the token is invalid or the user is not found.
         """
-        try:
-            payload = await AuthService.decode_access_token(token)
-            useremail: str = payload.get("sub")
-            if useremail is None:
-                raise AuthUsers.credentials_exception
-            token_data = TokenData(username=useremail)
-
-            user = await FetchService.get_user_by_email(token_data.username, db)
-            if not user:
-                raise AuthUsers.credentials_exception
+        # HTTPExceptions from token decoding propagate as they are (401 for bad tokens)
+        payload = decode_access_token(token)
+        useremail = payload.get("sub")
+        # A plain type check stands in for the TokenData model on this hot path
+        if not isinstance(useremail, str):
+            logger.warning("Invalid token provided.")
+            raise AuthUsers.credentials_exception
+
+        user = AuthUsers.user_cache.get(useremail)
+        if user is not None:
             return user
-        except ValidationError as exc:
-            AuthUsers.logger.warning("Invalid token provided.")
-            raise AuthUsers.credentials_exception from exc
-        except Exception as e:
-            AuthUsers.logger.error("Error fetching current user: %s", e, exc_info=True)
-            raise HTTPException(
-                status_code=500, detail="Failed to get the current user!"
-            ) from e
+
+        user = await FetchService.find_user_by_email(useremail, db)
+        if not user:
+            raise AuthUsers.credentials_exception
+        AuthUsers.user_cache[useremail] = user
+        return user
+
+    @staticmethod
+    def evict(email: str):
+        """
+        Drop a user from the authentication cache after their stored details change.
+
+        Args:
+            email (str): The email of the user.
+        """
+        AuthUsers.user_cache.pop(email, None)
 
     @staticmethod
     async def verify_user(
-        current_user: Annotated[UserCreate, Security(get_current_user)]
+        current_user: Annotated[UserCreate, Security(get_current_user.__func__)]
     ) -> dict:
         """
         Fetch the current active user.